@@ -6,10 +6,9 @@ import matplotlib.pyplot as plt
 # Beweis: Chladni-Knotenlinien vs. Biologische Adern
 # =========================================================
 
-def plot_wing_proof():
+def compute_wing_field(mode_theta=5.0, mode_r=0.5, sector_scale=4.0, resolution=500):
     # 1. SETUP DES RAUMS (Rechteck für den Plot)
     # Ein Flügel ist ca. 2.5mm lang und 1.0mm breit
-    resolution = 500
     x = np.linspace(0, 2.5, resolution)
     y = np.linspace(0, 1.2, int(resolution/2))
     X, Y = np.meshgrid(x, y)
@@ -29,25 +28,23 @@ def plot_wing_proof():
     # 3. DIE DOMBOIS FORMEL (Stehende Welle)
     # Mode Theta = 5.0 (Erzeugt 5 Knotenlinien im Fächer)
     # Mode R = 0.5 (Eine halbe Welle entlang der Länge)
-    mode_theta = 5.0
-    mode_r = 0.5
-    
     # Die Wellenfunktion:
     # Z = sin(Radial) * cos(Angular)
     # Wir normalisieren Theta leicht, um den Sektor anzupassen (-20 bis +20 Grad)
-    sector_scale = 4.0 # Spreizungs-Faktor
-    
+    # sector_scale = Spreizungs-Faktor
     wave = np.sin(mode_r * np.pi * R / 2.5) * np.cos(mode_theta * Theta * sector_scale)
     
     # ENERGIE-FELD (Vibration)
     # Wir nehmen das Quadrat -> Energie ist immer positiv
     energy = wave**2
-    
-    # 4. DIE REALITÄT (FlyBase Daten Approximation)
+    return x, y, energy
+
+def real_vein_curves(samples=100):
+    # DIE REALITÄT (FlyBase Daten Approximation)
     # Koordinaten der echten Adern L2-L5
     # Alle starten bei 0, 0.5
     
-    t = np.linspace(0, 2.4, 100)
+    t = np.linspace(0, 2.4, samples)
     
     # L2: Radius (Biegt nach oben)
     l2_y = 0.5 + 0.35 * np.sin(t/1.8)
@@ -59,8 +56,14 @@ def plot_wing_proof():
     l4_y = 0.5 - 0.2 * t
     
     # L5: Anal (Kurz, biegt stark nach unten)
-    t5 = np.linspace(0, 1.6, 100)
+    t5 = np.linspace(0, 1.6, samples)
     l5_y = 0.5 - 0.4 * np.sin(t5/1.2) - 0.1*t5
+    return t, l2_y, l3_y, l4_y, t5, l5_y
+
+def plot_wing_proof():
+    x, y, energy = compute_wing_field()
+    
+    t, l2_y, l3_y, l4_y, t5, l5_y = real_vein_curves()
 
     # --- PLOTTING ---
     fig, ax = plt.subplots(figsize=(10, 5), facecolor='#111111')
@@ -99,4 +102,5 @@ def plot_wing_proof():
     plt.tight_layout()
     plt.show()
 
-plot_wing_proof()
+if __name__ == '__main__':
+    plot_wing_proof()
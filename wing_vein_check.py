@@ -0,0 +1,90 @@
+import os
+import sys
+import time
+import tempfile
+
+import numpy as np
+
+from drosophila_morph import real_vein_curves
+from wing_vein_scorer import (WING_MODES, HINGE_Y_MM, align_to_hinge,
+                              score_mask, score_file, score_wing_batch)
+
+# =========================================================
+# THE DOMBOIS PROTOCOL: SELF-CHECK & BENCHMARK (Wing Scorer)
+# Synthetischer Flügel aus L2-L5 -> muss sauber ausgerichtet werden
+# =========================================================
+
+PX_PER_MM = 400
+MASK_SHAPE = (480, 1040)  # ca. 1.2mm x 2.6mm bei 400 px/mm
+
+
+def synthetic_wing_mask():
+    # Zeichnet die FlyBase-Approximation L2-L5 als 1px-Linien ins Bild.
+    # Gelenk bei (x=0.05mm, y=0.5mm), Bild-Oberkante bei y=1.0mm.
+    t, l2_y, l3_y, l4_y, t5, l5_y = real_vein_curves(samples=4000)
+    mask = np.zeros(MASK_SHAPE, dtype=bool)
+    for xs, ys in [(t, l2_y), (t, l3_y), (t, l4_y), (t5, l5_y)]:
+        cols = np.rint((xs + 0.05) * PX_PER_MM).astype(np.intp)
+        rows = np.rint((1.0 - ys) * PX_PER_MM).astype(np.intp)
+        mask[rows, cols] = True
+    return mask
+
+
+def self_check():
+    mask = synthetic_wing_mask()
+
+    # 1. Ausrichtung: Gelenk muss bei y=0.5mm landen
+    x_mm, y_mm = align_to_hinge(mask)
+    hinge_y = y_mm[x_mm < 0.01].mean()
+    assert abs(hinge_y - HINGE_Y_MM) < 0.01, f"Gelenk bei y={hinge_y:.3f}mm"
+    assert abs(x_mm.max() - 2.4) < 1e-6
+
+    # 2. Scores: endlich und Mode-abhängig; L5 ragt unter y=0 -> out_of_field > 0
+    scores, out_fraction = score_mask(mask)
+    assert np.all(np.isfinite(scores)), scores
+    assert np.ptp(scores) > 1e-3, scores
+    assert 0 < out_fraction < 0.1, out_fraction
+
+    # 3. Leere Maske -> NaN
+    scores, out_fraction = score_mask(np.zeros(MASK_SHAPE, dtype=bool))
+    assert np.all(np.isnan(scores)) and np.isnan(out_fraction)
+
+    # 4. Falsche Shape / defekte Datei -> NaN-Zeile statt Absturz
+    with tempfile.TemporaryDirectory() as tmp:
+        rgb = os.path.join(tmp, 'rgb.npy')
+        np.save(rgb, np.zeros(MASK_SHAPE + (3,), dtype=bool))
+        broken = os.path.join(tmp, 'broken.npy')
+        with open(broken, 'wb') as f:
+            f.write(b'\x93NUMPY kaputt')
+        for path in (rgb, broken):
+            scores, _ = score_file(path)
+            assert np.all(np.isnan(scores))
+
+    for (mode_theta, mode_r), s in zip(WING_MODES, score_mask(mask)[0]):
+        print(f"Mode θ={mode_theta}, r={mode_r}: {s:.4f} mm")
+    print("✅ Self-Check bestanden.")
+
+
+def benchmark(n_images=2000, workers=None):
+    mask = synthetic_wing_mask()
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i in range(n_images):
+            path = os.path.join(tmp, f'wing_{i:05d}.npy')
+            np.save(path, mask)
+            paths.append(path)
+
+        start = time.perf_counter()
+        scores, _ = score_wing_batch(paths, workers=workers)
+        elapsed = time.perf_counter() - start
+
+    workers = workers or os.cpu_count()
+    print(f"--- Benchmark: {n_images} Masken {MASK_SHAPE}, {workers} Worker ---")
+    print(f"{elapsed:.2f} s -> {n_images / elapsed:.0f} Bilder/s "
+          f"({n_images / elapsed / workers:.0f} Bilder/s pro Worker)")
+
+
+if __name__ == '__main__':
+    self_check()
+    if '--benchmark' in sys.argv:
+        benchmark()
@@ -0,0 +1,196 @@
+import os
+import sys
+import csv
+import glob
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from scipy.ndimage import distance_transform_edt
+
+from drosophila_morph import compute_wing_field
+
+# =========================================================
+# THE DOMBOIS PROTOCOL: WING BATCH SCORING UNIT (2D)
+# Beweis im Großen: Tausende echte Flügel vs. Knotenlinien
+# =========================================================
+# Eingabe: Binäre Adern-Masken als .npy (True/1 = Ader),
+# Flügel zeigt nach rechts, Gelenk (Hinge) liegt links.
+
+# Modes, gegen die jeder Flügel getestet wird: (mode_theta, mode_r)
+WING_MODES = [(5.0, 0.5), (4.0, 0.5), (6.0, 0.5)]
+
+# Unterhalb dieser Energie gilt ein Punkt als Knoten (Ruhe-Zone)
+NODAL_THRESHOLD = 0.02
+
+# Gelenk-Scheibe: sin(mode_r * pi * R / 2.5) -> 0 am Gelenk, d.h. ALLES
+# nahe am Gelenk ist "Knoten", egal welcher Winkel-Mode. Bei mode_r=0.5
+# und NODAL_THRESHOLD=0.02 gilt das bis R ~ 0.23mm. Ohne Ausschluss
+# bekäme jede Ader dort gratis Abstand 0 (ca. 9% ihrer Länge).
+# Deshalb fliegt R < HINGE_CUTOFF_MM aus Knoten-Menge UND Bewertung.
+HINGE_CUTOFF_MM = 0.25
+
+# Länge der echten Adern in mm (L2-L4 enden bei ca. 2.4mm)
+VEIN_LENGTH_MM = 2.4
+HINGE_Y_MM = 0.5
+
+
+# ==========================================
+# 1. DISTANZ-KARTE (einmal pro Mode)
+# ==========================================
+@lru_cache(maxsize=None)
+def nodal_distance_map(mode_theta, mode_r, resolution=500):
+    # Für jeden Punkt im Feld: Abstand (mm) zur nächsten Knotenlinie.
+    # Wird pro Prozess nur einmal berechnet und dann wiederverwendet.
+    x, y, energy = compute_wing_field(mode_theta, mode_r, resolution=resolution)
+    dx = x[1] - x[0]
+    dy = y[1] - y[0]
+    X, Y = np.meshgrid(x, y)
+    outside_hinge = np.hypot(X, Y - HINGE_Y_MM) >= HINGE_CUTOFF_MM
+    nodal = (energy < NODAL_THRESHOLD) & outside_hinge
+    dist = distance_transform_edt(~nodal, sampling=(dy, dx)).astype(np.float32)
+    dist.setflags(write=False)
+    return dist, dx, dy
+
+
+# ==========================================
+# 2. AUSRICHTUNG AM GELENK
+# ==========================================
+def align_to_hinge(mask):
+    # Pixel-Koordinaten der Adern -> Flügel-Koordinaten in mm.
+    # Gelenk = mittlere Zeile der Adern-Pixel am linken Rand,
+    # Maßstab = Adern-Länge in Pixeln entspricht VEIN_LENGTH_MM.
+    if mask.ndim != 2:
+        raise ValueError(f"Maske muss 2D sein, hat aber Shape {mask.shape}")
+
+    rows, cols = np.nonzero(mask)
+    if cols.size == 0:
+        return None, None
+
+    col0 = cols.min()
+    length_px = cols.max() - col0
+    if length_px == 0:
+        return None, None
+
+    band = max(1, int(0.02 * mask.shape[1]))
+    hinge_row = rows[cols <= col0 + band].mean()
+
+    scale = VEIN_LENGTH_MM / length_px
+    x_mm = (cols - col0) * scale
+    # Bild-Zeilen wachsen nach unten, das Feld wächst nach oben
+    y_mm = HINGE_Y_MM + (hinge_row - rows) * scale
+    return x_mm, y_mm
+
+
+# ==========================================
+# 3. SCORE PRO BILD
+# ==========================================
+def score_mask(mask, modes=WING_MODES):
+    # Mittlerer Abstand (mm) der Adern zur nächsten Knotenlinie.
+    # Kleiner = Adern liegen näher an den Ruhe-Zonen.
+    # Gibt (scores pro Mode, Anteil der Adern-Pixel außerhalb des Feldes) zurück.
+    x_mm, y_mm = align_to_hinge(mask)
+    scores = np.full(len(modes), np.nan, dtype=np.float32)
+    if x_mm is None:
+        return scores, np.nan
+
+    # Pixel in der Gelenk-Scheibe werden nicht bewertet (siehe HINGE_CUTOFF_MM)
+    keep = np.hypot(x_mm, y_mm - HINGE_Y_MM) >= HINGE_CUTOFF_MM
+
+    # Alle Modes teilen dasselbe Raster -> Indizes nur einmal berechnen
+    dist, dx, dy = nodal_distance_map(*modes[0])
+    ix = np.rint(x_mm / dx).astype(np.intp)
+    iy = np.rint(y_mm / dy).astype(np.intp)
+    # Pixel außerhalb des Feldes NICHT an den Rand klemmen, sondern auslassen
+    inside = (ix >= 0) & (ix < dist.shape[1]) & (iy >= 0) & (iy < dist.shape[0])
+    out_fraction = 1.0 - inside[keep].mean() if keep.any() else np.nan
+
+    sel = inside & keep
+    if not sel.any():
+        return scores, out_fraction
+    ix, iy = ix[sel], iy[sel]
+
+    for i, (mode_theta, mode_r) in enumerate(modes):
+        dist, _, _ = nodal_distance_map(mode_theta, mode_r)
+        scores[i] = dist[iy, ix].mean()
+    return scores, out_fraction
+
+
+def score_file(path, modes=WING_MODES):
+    # Memory-Mapping: Die Maske wird erst beim Zugriff von der Platte gelesen.
+    # Defekte Dateien liefern eine NaN-Zeile, statt den ganzen Batch zu stoppen.
+    try:
+        mask = np.load(path, mmap_mode='r')
+        return score_mask(mask, modes)
+    except (OSError, ValueError, EOFError) as e:
+        print(f"⚠️ WARNUNG: {path} übersprungen: {e}")
+        return np.full(len(modes), np.nan, dtype=np.float32), np.nan
+
+
+def _warm_cache(modes):
+    for mode_theta, mode_r in modes:
+        nodal_distance_map(mode_theta, mode_r)
+
+
+def _score_chunk(args):
+    paths, modes = args
+    results = [score_file(p, modes) for p in paths]
+    scores = np.stack([r[0] for r in results])
+    out_fractions = np.array([r[1] for r in results], dtype=np.float32)
+    return scores, out_fractions
+
+
+# ==========================================
+# 4. BATCH ÜBER DEN PROZESS-POOL
+# ==========================================
+def score_wing_batch(paths, modes=WING_MODES, workers=None):
+    # Gibt (scores, out_fractions) zurück:
+    # scores.shape = (len(paths), len(modes)), out_fractions.shape = (len(paths),)
+    modes = tuple(tuple(m) for m in modes)
+    if len(paths) == 0:
+        return np.empty((0, len(modes)), dtype=np.float32), np.empty(0, dtype=np.float32)
+
+    workers = workers or os.cpu_count() or 1
+    # Ca. 4 Chunks pro Worker -> alle Prozesse bleiben beschäftigt
+    chunksize = max(1, len(paths) // (4 * workers))
+
+    chunks = [(paths[i:i + chunksize], modes) for i in range(0, len(paths), chunksize)]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_warm_cache,
+                             initargs=(modes,)) as pool:
+        results = list(pool.map(_score_chunk, chunks))
+    scores = np.concatenate([r[0] for r in results])
+    out_fractions = np.concatenate([r[1] for r in results])
+    return scores, out_fractions
+
+
+def run_batch(folder):
+    paths = sorted(glob.glob(os.path.join(folder, '*.npy')))
+    if not paths:
+        print(f"❌ FEHLER: Keine .npy Masken in {folder} gefunden.")
+        return
+
+    print(f"--- Bewerte {len(paths)} Flügel gegen {len(WING_MODES)} Modes ---")
+    scores, out_fractions = score_wing_batch(paths)
+
+    for (mode_theta, mode_r), col in zip(WING_MODES, scores.T):
+        valid = col[~np.isnan(col)]
+        if valid.size == 0:
+            continue
+        print(f"Mode θ={mode_theta}, r={mode_r}: "
+              f"Median-Abstand {np.median(valid):.4f} mm ({valid.size} Flügel)")
+
+    misaligned = np.sum(out_fractions > 0.1)
+    if misaligned:
+        print(f"⚠️ WARNUNG: {misaligned} Flügel mit >10% Adern außerhalb des Feldes.")
+
+    target_file = os.path.join(folder, 'wing_scores.csv')
+    with open(target_file, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['file'] + [f'theta{t}_r{r}' for t, r in WING_MODES] + ['out_of_field'])
+        for path, row, out in zip(paths, scores, out_fractions):
+            writer.writerow([os.path.basename(path)] + [f'{v:.5f}' for v in row] + [f'{out:.5f}'])
+    print(f"Scores gespeichert in: {target_file}")
+
+
+if __name__ == '__main__':
+    run_batch(sys.argv[1] if len(sys.argv) > 1 else 'wing_masks')